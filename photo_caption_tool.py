@@ -1,20 +1,27 @@
 import configparser
 import csv
+import functools
+import io
+import json
 import math
 import os
 import platform
 import re
 import shutil
 import subprocess
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from PIL import Image, ImageOps, ImageFont, ImageDraw
-from pillow_heif import register_heif_opener
-from docx import Document
-from docx.shared import Inches, Mm
+# Pillow, pillow-heif, and python-docx are imported by the actions that need them,
+# so that the menu and the EXIF and CSV actions start without loading them.
+# Importing this module should stay within a 50 ms startup budget.
+if TYPE_CHECKING:
+    from PIL import Image, ImageFont
 
 
-register_heif_opener()
 configs = configparser.ConfigParser(comment_prefixes="|", allow_no_value=True)
 configs.optionxform = str
 images_directory = ""
@@ -34,6 +41,37 @@ class highlight:
         return f"\033[1m{thetext}\033[0m"
 
 
+def _annotate_image(thephoto: dict) -> "Image.Image":
+    from PIL import ImageDraw, ImageOps
+
+    label = _make_label(thephoto)
+    orientation = all_images_exif_data[thephoto["Photo"]]["orientation"]
+    if not orientation:
+        orientation = "1"
+    img = _open_image(Path(images_directory) / thephoto["Photo"])
+    img = img.rotate(rotation.index(orientation) * 90, expand=True)
+    img = ImageOps.pad(img, (img.width, img.height + 320), centering=(0, 0))
+    img_annotation = ImageDraw.Draw(img, mode="RGB")
+    img_annotation.text(
+        (20, img.height - 290),
+        "\n".join(label),
+        font=_annotation_font(),
+        fill=(255, 255, 255),
+        spacing=20,
+    )
+    return img
+
+
+@functools.lru_cache(maxsize=None)
+def _annotation_font() -> "ImageFont.FreeTypeFont":
+    from PIL import ImageFont
+
+    try:
+        return ImageFont.truetype("Helvetica.ttc", 46)
+    except:
+        return ImageFont.truetype("arial.ttf", 46)
+
+
 def _build_new_caption(project, site, subject, description) -> str:
     caption = ""
     if project:
@@ -46,6 +84,46 @@ def _build_new_caption(project, site, subject, description) -> str:
     return caption
 
 
+def _caption_tags(thephoto: dict) -> list:
+    caption = _build_new_caption(
+        thephoto["Project"],
+        thephoto["Site"],
+        thephoto["Subject"],
+        thephoto["Description"],
+    )
+    return [
+        f"-artist={thephoto['Photographer']}",
+        f"-imagedescription={caption}",
+        f"-caption-abstract={caption}",
+        f"-description={caption}",
+        "--usercomment",
+    ]
+
+
+def _copy_photo(source: Path, destination: Path) -> None:
+    # On Linux, copy_file_range lets the kernel copy (or, on copy-on-write filesystems,
+    # clone) the file without passing its data through python. Elsewhere, or where it
+    # isn't supported between the two filesystems, shutil.copyfile uses the platform's
+    # own fast path (fcopyfile on MacOS, sendfile on Linux).
+    size = source.stat().st_size
+    copied = 0
+    if hasattr(os, "copy_file_range"):
+        with open(source, "rb") as fsrc, open(destination, "wb") as fdst:
+            try:
+                while copied < size:
+                    sent = os.copy_file_range(
+                        fsrc.fileno(), fdst.fileno(), size - copied, copied, copied
+                    )
+                    if not sent:
+                        break
+                    copied += sent
+            except OSError:
+                copied = 0
+    if copied < size:
+        shutil.copyfile(source, destination)
+    shutil.copystat(source, destination)
+
+
 def _display_menu() -> str:
     global valid_actions
     if images_directory:
@@ -73,6 +151,8 @@ def _display_menu() -> str:
             if word_doc.is_file():
                 print(f" {highlight.bold('7')} - View Contact Sheet")
                 valid_actions.append("7")
+            print(f" {highlight.bold('8')} - Export Photos to ZIP File")
+            valid_actions.append("8")
     print("     ------------")
     print(f" {highlight.bold('E')} - Edit Configs")
     valid_actions.append("E")
@@ -82,6 +162,42 @@ def _display_menu() -> str:
     return input("> ").upper()
 
 
+def _exported_photo(thephoto: dict, annotated: bool) -> tuple:
+    source = Path(images_directory) / thephoto["Photo"]
+    tags = _caption_tags(thephoto)
+    photo_data = None
+    target = source
+    if annotated or thephoto["Photo"].split(".")[-1].upper() == "HEIC":
+        if annotated:
+            img = _annotate_image(thephoto)
+            tags = ["-tagsFromFile", source, "-all:all", *tags]
+        else:
+            img = _open_image(source)
+        buffer = io.BytesIO()
+        img.save(buffer, format="JPEG", quality=80, optimize=True, progressive=True)
+        img.close()
+        photo_data = buffer.getvalue()
+        target = "-"
+    # exiftool reads the photo from stdin ("-") or the source file, and writes the updated photo to stdout ("-o -").
+    result = subprocess.run(
+        [
+            Path(configs.get("EXIFTOOL", "exiftool")),
+            *tags,
+            "-o",
+            "-",
+            target,
+        ],
+        input=photo_data,
+        capture_output=True,
+    )
+    if result.returncode == 0 and result.stdout:
+        return result.stdout, True
+    # The photo is still exported, but without its updated metadata.
+    if photo_data is None:
+        photo_data = source.read_bytes()
+    return photo_data, False
+
+
 def _facing(azimuth: str) -> str:
     if configs.get("FACING", "precision").lower() == "coarse":
         increment = 22.5
@@ -128,6 +244,100 @@ def _facing(azimuth: str) -> str:
     return bearing
 
 
+def _load_site_boundaries(sites_file: Path) -> dict:
+    with open(sites_file, "r") as f:
+        geojson = json.load(f)
+    sites = []
+    for each_feature in geojson.get("features", []):
+        geometry = each_feature.get("geometry") or {}
+        if geometry.get("type") == "Polygon":
+            rings = geometry["coordinates"]
+        elif geometry.get("type") == "MultiPolygon":
+            rings = [x for each_polygon in geometry["coordinates"] for x in each_polygon]
+        else:
+            continue
+        site = (each_feature.get("properties") or {}).get(
+            configs.get("DEFAULTS", "siteproperty")
+        )
+        if not rings or not site:
+            continue
+        # GeoJSON positions are longitude, latitude.
+        rings = [[(float(x[0]), float(x[1])) for x in each_ring] for each_ring in rings]
+        longitudes = [x[0] for each_ring in rings for x in each_ring]
+        latitudes = [x[1] for each_ring in rings for x in each_ring]
+        sites.append(
+            {
+                "site": str(site),
+                "bbox": (
+                    min(longitudes),
+                    min(latitudes),
+                    max(longitudes),
+                    max(latitudes),
+                ),
+                "rings": rings,
+            }
+        )
+    # Sites are indexed on a grid whose cells are about the size of the median site,
+    # so each photo is only tested against the few sites that share its grid cell.
+    # Sites covering more than a few cells (like a survey area or region outline)
+    # are indexed on coarser grids in the same way, one level per size of site.
+    levels = []
+    remaining = list(range(len(sites)))
+    while remaining:
+        extents = sorted(
+            max(
+                sites[i]["bbox"][2] - sites[i]["bbox"][0],
+                sites[i]["bbox"][3] - sites[i]["bbox"][1],
+            )
+            for i in remaining
+        )
+        cellsize = extents[len(extents) // 2] or 1.0
+        grid = {}
+        oversized = []
+        for i in remaining:
+            min_lon, min_lat, max_lon, max_lat = sites[i]["bbox"]
+            columns = range(
+                math.floor(min_lon / cellsize), math.floor(max_lon / cellsize) + 1
+            )
+            rows = range(
+                math.floor(min_lat / cellsize), math.floor(max_lat / cellsize) + 1
+            )
+            if len(columns) * len(rows) > 16:
+                oversized.append(i)
+                continue
+            for column in columns:
+                for row in rows:
+                    grid.setdefault((column, row), []).append(i)
+        levels.append({"cellsize": cellsize, "grid": grid})
+        remaining = oversized
+    return {"levels": levels, "sites": sites}
+
+
+def _lookup_site(site_index: dict, gpsposition: str) -> str:
+    position = _parse_gps_position(gpsposition)
+    if not site_index or not position:
+        return ""
+    latitude, longitude = position
+    candidates = []
+    for each_level in site_index["levels"]:
+        cell = (
+            math.floor(longitude / each_level["cellsize"]),
+            math.floor(latitude / each_level["cellsize"]),
+        )
+        candidates += each_level["grid"].get(cell, [])
+    # Sites are tested in file order, so the first matching site wins where they overlap.
+    for i in sorted(candidates):
+        each_site = site_index["sites"][i]
+        min_lon, min_lat, max_lon, max_lat = each_site["bbox"]
+        if (
+            min_lon <= longitude <= max_lon
+            and min_lat <= latitude <= max_lat
+            and _point_in_rings(longitude, latitude, each_site["rings"])
+        ):
+            return each_site["site"]
+    return ""
+
+
 def _make_label(thephoto: dict) -> list:
     label = []
     line = []
@@ -157,13 +367,77 @@ def _make_label(thephoto: dict) -> list:
     return label
 
 
+def _new_filename(thephoto: dict) -> str:
+    filename = ".".join(thephoto["Photo"].split(".")[:-1])
+    if configs.get("RENAMING", "format") == "1":
+        if thephoto["Subject"]:
+            if thephoto["Photographer"]:
+                filename = f"{thephoto['Subject']} -- {thephoto['Photographer']}_{filename}"
+            else:
+                filename = f"{thephoto['Subject']} -- {filename}"
+    elif configs.get("RENAMING", "format") == "2":
+        filename = f"{thephoto['Site']}_{thephoto['Subject']}_{thephoto['Sequence']}.jpg"
+    return filename
+
+
+def _open_image(image_file: Path) -> "Image.Image":
+    from PIL import Image
+
+    if image_file.suffix.upper() == ".HEIC":
+        _register_heif_opener()
+    return Image.open(image_file)
+
+
+def _parse_gps_position(gpsposition: str) -> tuple:
+    # exiftool formats positions like: 40 deg 26' 46.30" N, 79 deg 58' 56.00" W
+    coordinates = re.findall(
+        r"(\d+(?:\.\d+)?) deg (\d+(?:\.\d+)?)' (\d+(?:\.\d+)?)\" ([NSEW])",
+        gpsposition,
+    )
+    if len(coordinates) != 2:
+        return ()
+    position = []
+    for degrees, minutes, seconds, hemisphere in coordinates:
+        decimal = float(degrees) + float(minutes) / 60 + float(seconds) / 3600
+        if hemisphere in ["S", "W"]:
+            decimal = -decimal
+        position.append(decimal)
+    return tuple(position)
+
+
+def _point_in_rings(longitude: float, latitude: float, rings: list) -> bool:
+    # Even-odd ray casting across all of the rings, so holes are excluded.
+    inside = False
+    for each_ring in rings:
+        j = len(each_ring) - 1
+        for i in range(len(each_ring)):
+            lon_i, lat_i = each_ring[i]
+            lon_j, lat_j = each_ring[j]
+            if (lat_i > latitude) != (lat_j > latitude) and longitude < (
+                lon_j - lon_i
+            ) * (latitude - lat_i) / (lat_j - lat_i) + lon_i:
+                inside = not inside
+            j = i
+    return inside
+
+
+def _print_numbered_photos(numbered_photos: list) -> None:
+    if numbered_photos:
+        print("\n")
+        print(
+            f"{highlight.red('NOTICE:')} The following photos would have had the same name as another photo, so they were numbered."
+        )
+        for each_numbered_photo in numbered_photos:
+            print(f" - {each_numbered_photo}")
+
+
 def _read_configs() -> None:
     global configs
     if not Path("configs.ini").is_file():
         with open("configs.ini", "w") as f:
             pass
     configs.read("configs.ini")
-    sections = ["EXIFTOOL", "DEFAULTS", "FACING", "RENAMING"]
+    sections = ["EXIFTOOL", "DEFAULTS", "FACING", "RENAMING", "EXPORT"]
     for each_section in sections:
         if not configs.has_section(each_section):
             configs.add_section(each_section)
@@ -193,6 +467,18 @@ def _read_configs() -> None:
         configs.set("DEFAULTS", "project", "")
     if not configs.has_option("DEFAULTS", "site"):
         configs.set("DEFAULTS", "site", "")
+    if not configs.has_option("DEFAULTS", "siteboundaries"):
+        configs.set(
+            "DEFAULTS",
+            "# siteboundaries is an optional GeoJSON file of site polygons, used to set each photo’s site from its GPS coordinates",
+        )
+        configs.set("DEFAULTS", "siteboundaries", "")
+    if not configs.has_option("DEFAULTS", "siteproperty"):
+        configs.set(
+            "DEFAULTS",
+            "# siteproperty is the property of each GeoJSON feature that holds the site’s name",
+        )
+        configs.set("DEFAULTS", "siteproperty", "name")
     # FACING section settings
     if not configs.has_option("FACING", "precision"):
         configs.set("FACING", "# precision options are")
@@ -206,6 +492,14 @@ def _read_configs() -> None:
         configs.set("RENAMING", "#   '1' (Subject -- Photographer_Photo.jpg)")
         configs.set("RENAMING", "#   '2' (Site_Subject_Sequence.jpg)")
         configs.set("RENAMING", "format", "1")
+    if not configs.has_option("RENAMING", "concurrentcopies"):
+        configs.set("RENAMING", "# concurrentcopies is the number of photos copied at once")
+        configs.set("RENAMING", "concurrentcopies", "4")
+    # EXPORT section settings
+    if not configs.has_option("EXPORT", "volumesize"):
+        configs.set("EXPORT", "# volumesize is the maximum size of each ZIP file in MB")
+        configs.set("EXPORT", "#   '0' (a single ZIP file of unlimited size)")
+        configs.set("EXPORT", "volumesize", "0")
     with open("configs.ini", "w") as f:
         configs.write(f)
     if not shutil.which(configs.get("EXIFTOOL", "exiftool")):
@@ -215,6 +509,40 @@ def _read_configs() -> None:
         )
 
 
+@functools.lru_cache(maxsize=None)
+def _register_heif_opener() -> None:
+    from pillow_heif import register_heif_opener
+
+    register_heif_opener()
+
+
+def _rename_photo(thephoto: dict, output_dir: Path, filename: str) -> int:
+    if thephoto["Photo"].split(".")[-1].upper() == "HEIC":
+        img = _open_image(Path(images_directory) / thephoto["Photo"])
+        img.save(
+            Path(output_dir) / filename,
+            quality=80,
+            optimize=True,
+            progressive=True,
+        )
+        img.close()
+    else:
+        _copy_photo(
+            Path(images_directory) / thephoto["Photo"],
+            Path(output_dir) / filename,
+        )
+    _ = subprocess.run(
+        [
+            Path(configs.get("EXIFTOOL", "exiftool")),
+            *_caption_tags(thephoto),
+            "-overwrite_original",
+            Path(output_dir) / filename,
+        ],
+        capture_output=True,
+    )
+    return (Path(output_dir) / filename).stat().st_size
+
+
 def _replace_invalid_filename_characters(thestring: str) -> str:
     invalid_chars = ["<", ">", ":", '"', "/", "\\", "|", "?", "*"]
     for each_char in invalid_chars:
@@ -222,6 +550,57 @@ def _replace_invalid_filename_characters(thestring: str) -> str:
     return thestring
 
 
+def _unique_filenames(photos: list, suffix: str) -> tuple:
+    # Photos that would get the same name (like IMG_0001.JPG and IMG_0001.HEIC) are
+    # numbered rather than written over each other.
+    filenames = []
+    used_filenames = set()
+    numbered_photos = []
+    for each_photo in photos:
+        filename = f"{_new_filename(each_photo)}{suffix}"
+        n = 2
+        while filename.lower() in used_filenames:
+            filename = f"{_new_filename(each_photo)} ({n}){suffix}"
+            n += 1
+        if n > 2:
+            numbered_photos.append(f"{each_photo['Photo']} → {filename}")
+        filenames.append(filename)
+        used_filenames.add(filename.lower())
+    return filenames, numbered_photos
+
+
+def _zip_volume(
+    volumes: list, archive_name: str, entry_name: str, entry_size: int
+) -> zipfile.ZipFile:
+    # Each volume is a complete ZIP file, so a photo is never split across volumes.
+    volume_size = int(float(configs.get("EXPORT", "volumesize")) * 1000 * 1000)
+    # Local header, central directory record, and room for zip64 extras.
+    entry_overhead = 200 + 2 * len(entry_name.encode())
+    if volumes:
+        volume = volumes[-1]
+        projected_size = (
+            volume["archive"].fp.tell()
+            + volume["directorysize"]
+            + entry_size
+            + entry_overhead
+        )
+        if (
+            not volume_size
+            or not volume["archive"].filelist
+            or projected_size <= volume_size
+        ):
+            volume["directorysize"] += entry_overhead
+            return volume["archive"]
+        volume["archive"].close()
+    archive = zipfile.ZipFile(
+        Path(images_directory) / f"{archive_name} - Part {len(volumes) + 1}.zip",
+        "w",
+        compression=zipfile.ZIP_STORED,
+    )
+    volumes.append({"archive": archive, "directorysize": entry_overhead})
+    return archive
+
+
 def annotate_photos() -> None:
     global all_images_exif_data
     csv_file = Path(images_directory) / "Photo Log.csv"
@@ -244,35 +623,8 @@ def annotate_photos() -> None:
         i = 1
         for each_photo in reader:
             print(f"{i}: Annotating photo {each_photo['Photo']}.")
-            label = _make_label(each_photo)
-            orientation = all_images_exif_data[each_photo["Photo"]]["orientation"]
-            if not orientation:
-                orientation = "1"
-            img = Image.open(Path(images_directory) / each_photo["Photo"])
-            img = img.rotate(rotation.index(orientation) * 90, expand=True)
-            img = ImageOps.pad(img, (img.width, img.height + 320), centering=(0, 0))
-            img_annotation = ImageDraw.Draw(img, mode="RGB")
-            try:
-                thefont = ImageFont.truetype("Helvetica.ttc", 46)
-            except:
-                thefont = ImageFont.truetype("arial.ttf", 46)
-            img_annotation.text(
-                (20, img.height - 290),
-                "\n".join(label),
-                font=thefont,
-                fill=(255, 255, 255),
-                spacing=20,
-            )
-            filename = ".".join(each_photo["Photo"].split(".")[:-1])
-            if configs.get("RENAMING", "format") == "1":
-                if each_photo["Subject"]:
-                    if each_photo["Photographer"]:
-                        filename = f"{each_photo['Subject']} -- {each_photo['Photographer']}_{filename}"
-                    else:
-                        filename = f"{each_photo['Subject']} -- {filename}"
-            elif configs.get("RENAMING", "format") == "2":
-                filename = f"{each_photo['Site']}_{each_photo['Subject']}_{each_photo['Sequence']}.jpg"
-            filename = f"{filename}_Annotated.jpg"
+            img = _annotate_image(each_photo)
+            filename = f"{_new_filename(each_photo)}_Annotated.jpg"
             img.save(
                 Path(output_dir) / filename,
                 quality=80,
@@ -280,12 +632,6 @@ def annotate_photos() -> None:
                 progressive=True,
             )
             img.close()
-            caption = _build_new_caption(
-                each_photo["Project"],
-                each_photo["Site"],
-                each_photo["Subject"],
-                each_photo["Description"],
-            )
             _ = subprocess.run(
                 [
                     Path(configs.get("EXIFTOOL", "exiftool")),
@@ -293,11 +639,7 @@ def annotate_photos() -> None:
                     Path(images_directory) / each_photo["Photo"],
                     "-all:all",
                     Path(output_dir) / filename,
-                    f"-artist={each_photo['Photographer']}",
-                    f"-imagedescription={caption}",
-                    f"-caption-abstract={caption}",
-                    f"-description={caption}",
-                    "--usercomment",
+                    *_caption_tags(each_photo),
                     "-overwrite_original",
                     Path(output_dir) / filename,
                     "-overwrite_original",
@@ -333,12 +675,27 @@ def create_csv() -> None:
     data_for_csv = []
     errors = []
     sequence = 1
+    site_index = {}
+    if configs.get("DEFAULTS", "siteboundaries"):
+        try:
+            site_index = _load_site_boundaries(
+                Path(configs.get("DEFAULTS", "siteboundaries")).expanduser()
+            )
+        except:
+            print("\n")
+            print(
+                f"{highlight.red('NOTICE:')} The site boundaries file couldn’t be read. The default site will be used instead."
+            )
     for each_image in all_images_exif_data:
         image_data = {"Photo": each_image}
         try:
             image_data["Photographer"] = configs.get("DEFAULTS", "photographer")
             image_data["Project"] = configs.get("DEFAULTS", "project")
-            image_data["Site"] = configs.get("DEFAULTS", "site")
+            image_data["Site"] = _replace_invalid_filename_characters(
+                _lookup_site(
+                    site_index, all_images_exif_data[each_image]["gpsposition"]
+                )
+            ) or configs.get("DEFAULTS", "site")
             if not configs.get("DEFAULTS", "photographer"):
                 photographer = []
                 if all_images_exif_data[each_image]["artist"]:
@@ -420,6 +777,9 @@ def create_word_doc() -> None:
         != "Y"
     ):
         main()
+    from docx import Document
+    from docx.shared import Inches, Mm
+
     # Create a new Word document on A4 paper
     document = Document()
     section = document.sections[0]
@@ -510,6 +870,22 @@ def edit_configs() -> None:
             site = ""
         configs.set("DEFAULTS", "site", site)
 
+    # siteboundaries
+    print(
+        "Enter the path to a GeoJSON file of site boundaries. Dash (-) to clear this setting."
+    )
+    siteboundaries = input(f"[{configs.get('DEFAULTS', 'siteboundaries')}] > ")
+    if siteboundaries:
+        if siteboundaries == "-":
+            siteboundaries = ""
+        configs.set("DEFAULTS", "siteboundaries", siteboundaries.strip("'\""))
+
+    # siteproperty
+    print("Enter the GeoJSON property that holds the sites’ names.")
+    siteproperty = input(f"[{configs.get('DEFAULTS', 'siteproperty')}] > ")
+    if siteproperty:
+        configs.set("DEFAULTS", "siteproperty", siteproperty)
+
     # precision
     print("Enter the level of precision for the direction the photographs are facing.")
     print("(options are coarse, fine, or precise)")
@@ -536,11 +912,114 @@ def edit_configs() -> None:
                 format = configs.get("RENAMING", "format")
         configs.set("RENAMING", "format", format)
 
+    # concurrentcopies
+    print("Enter the number of photos to copy at once when renaming photos.")
+    concurrentcopies = input(f"[{configs.get('RENAMING', 'concurrentcopies')}] > ")
+    if concurrentcopies:
+        while not concurrentcopies.isdigit() or int(concurrentcopies) < 1:
+            print("Invalid option entered. Please enter a whole number of 1 or more.")
+            concurrentcopies = input(
+                f"[{configs.get('RENAMING', 'concurrentcopies')}] > "
+            )
+            if not concurrentcopies:
+                concurrentcopies = configs.get("RENAMING", "concurrentcopies")
+        configs.set("RENAMING", "concurrentcopies", concurrentcopies)
+
+    # volumesize
+    print("Enter the maximum size of exported ZIP files, in MB.")
+    print("(0 for a single ZIP file of unlimited size)")
+    volumesize = input(f"[{configs.get('EXPORT', 'volumesize')}] > ")
+    if volumesize:
+        while not re.fullmatch(r"\d+(\.\d+)?", volumesize):
+            print("Invalid option entered. Please enter a number.")
+            volumesize = input(f"[{configs.get('EXPORT', 'volumesize')}] > ")
+            if not volumesize:
+                volumesize = configs.get("EXPORT", "volumesize")
+        configs.set("EXPORT", "volumesize", volumesize)
+
     with open("configs.ini", "w") as f:
         configs.write(f)
     main()
 
 
+def export_zip() -> None:
+    csv_file = Path(images_directory) / "Photo Log.csv"
+    if not csv_file.is_file():
+        main()
+    print("Enter R to export renamed photos or A to export annotated photos.")
+    photos_type = input("> ").upper()
+    if photos_type not in ["R", "A"]:
+        main()
+    annotated = photos_type == "A"
+    archive_name = "Annotated Photos" if annotated else "Renamed Photos"
+    existing_archives = [
+        x
+        for x in Path(images_directory).glob(f"{archive_name}*.zip")
+        if re.fullmatch(rf"{re.escape(archive_name)}( - Part \d+)?\.zip", x.name)
+    ]
+    if existing_archives:
+        if (
+            input(
+                f"“{archive_name}.zip” already exists. Type “Y” to overwrite it.\n> "
+            ).upper()
+            != "Y"
+        ):
+            main()
+        else:
+            for each_archive in existing_archives:
+                each_archive.unlink()
+    extra_files = [csv_file]
+    word_doc = Path(images_directory) / "Contact Sheet.docx"
+    if (
+        word_doc.is_file()
+        and input(
+            f"Type “Y” to include “{word_doc.name}” in the ZIP file.\n> "
+        ).upper()
+        == "Y"
+    ):
+        extra_files.append(word_doc)
+    volumes = []
+    for each_file in extra_files:
+        archive = _zip_volume(
+            volumes, archive_name, each_file.name, each_file.stat().st_size
+        )
+        archive.write(each_file, each_file.name)
+    with open(csv_file, "r") as f:
+        photos = list(csv.DictReader(f))
+    filenames, numbered_photos = _unique_filenames(
+        photos, "_Annotated.jpg" if annotated else ".jpg"
+    )
+    untagged_photos = []
+    for i, (each_photo, filename) in enumerate(zip(photos, filenames), 1):
+        print(f"{i}: Exporting photo {each_photo['Photo']}.")
+        photo_data, tagged = _exported_photo(each_photo, annotated)
+        if not tagged:
+            untagged_photos.append(each_photo["Photo"])
+        archive = _zip_volume(volumes, archive_name, filename, len(photo_data))
+        modified = (Path(images_directory) / each_photo["Photo"]).stat().st_mtime
+        archive.writestr(
+            zipfile.ZipInfo(filename, date_time=time.localtime(modified)[:6]),
+            photo_data,
+        )
+    volumes[-1]["archive"].close()
+    if len(volumes) == 1:
+        (Path(images_directory) / f"{archive_name} - Part 1.zip").rename(
+            Path(images_directory) / f"{archive_name}.zip"
+        )
+        print(f"“{archive_name}.zip” created.")
+    else:
+        print(f"“{archive_name}” exported to {len(volumes)} ZIP volumes.")
+    _print_numbered_photos(numbered_photos)
+    if untagged_photos:
+        print("\n")
+        print(
+            f"{highlight.red('NOTICE:')} ExifTool couldn’t update the following photos, so they were exported without their new captions."
+        )
+        for each_untagged_photo in untagged_photos:
+            print(f" - {each_untagged_photo}")
+    main()
+
+
 def load_photos() -> None:
     global images_directory
     global all_images_exif_data
@@ -635,54 +1114,24 @@ def rename_photos() -> None:
             shutil.rmtree(output_dir)
     output_dir.mkdir(exist_ok=True)
     with open(csv_file, "r") as f:
-        reader = csv.DictReader(f)
-        i = 1
-        for each_photo in reader:
-            print(f"{i}: Renaming photo {each_photo['Photo']}.")
-            filename = ".".join(each_photo["Photo"].split(".")[:-1])
-            if configs.get("RENAMING", "format") == "1":
-                if each_photo["Subject"]:
-                    if each_photo["Photographer"]:
-                        filename = f"{each_photo['Subject']} -- {each_photo['Photographer']}_{filename}"
-                    else:
-                        filename = f"{each_photo['Subject']} -- {filename}"
-            elif configs.get("RENAMING", "format") == "2":
-                filename = f"{each_photo['Site']}_{each_photo['Subject']}_{each_photo['Sequence']}.jpg"
-            filename = f"{filename}.jpg"
-            if each_photo["Photo"].split(".")[-1].upper() == "HEIC":
-                img = Image.open(Path(images_directory) / each_photo["Photo"])
-                img.save(
-                    Path(output_dir) / filename,
-                    quality=80,
-                    optimize=True,
-                    progressive=True,
-                )
-                img.close()
-            else:
-                shutil.copy2(
-                    Path(images_directory) / each_photo["Photo"],
-                    Path(output_dir) / filename,
-                )
-            caption = _build_new_caption(
-                each_photo["Project"],
-                each_photo["Site"],
-                each_photo["Subject"],
-                each_photo["Description"],
-            )
-            _ = subprocess.run(
-                [
-                    Path(configs.get("EXIFTOOL", "exiftool")),
-                    f"-artist={each_photo['Photographer']}",
-                    f"-imagedescription={caption}",
-                    f"-caption-abstract={caption}",
-                    f"-description={caption}",
-                    "--usercomment",
-                    "-overwrite_original",
-                    Path(output_dir) / filename,
-                ],
-                capture_output=True,
-            )
-            i += 1
+        photos = list(csv.DictReader(f))
+    filenames, numbered_photos = _unique_filenames(photos, ".jpg")
+    start_time = time.perf_counter()
+    total_size = 0
+    with ThreadPoolExecutor(
+        max_workers=max(1, int(configs.get("RENAMING", "concurrentcopies")))
+    ) as executor:
+        renamed_photos = executor.map(
+            _rename_photo, photos, [output_dir] * len(photos), filenames
+        )
+        for i, (each_photo, photo_size) in enumerate(zip(photos, renamed_photos), 1):
+            print(f"{i}: Renamed photo {each_photo['Photo']}.")
+            total_size += photo_size
+    elapsed_time = time.perf_counter() - start_time
+    print(
+        f"Renamed {len(photos)} photos ({total_size / 1000000:.1f} MB) in {elapsed_time:.1f} seconds, including conversion and metadata updates: {total_size / 1000000 / max(elapsed_time, 0.001):.1f} MB/s."
+    )
+    _print_numbered_photos(numbered_photos)
     main()
 
 
@@ -725,6 +1174,8 @@ def main() -> None:
         create_word_doc()
     elif action == "7":
         view_word_doc()
+    elif action == "8":
+        export_zip()
     elif action == "E":
         edit_configs()
     elif action == "Q":